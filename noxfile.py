@@ -22,4 +22,4 @@ def pytest(session: nox.Session):
     session.install("pytest")
     session.run("pip", "check")
 
-    session.run("pytest", "tests", "src")
+    session.run("pytest", "-p", "no:cacheprovider", "tests", "src")
@@ -1,12 +1,17 @@
+from __future__ import annotations
+
 import sys
 from pathlib import Path
 from time import gmtime, strftime
+from typing import TYPE_CHECKING
 
-import tomlkit
 from cleez import Argument, Command
 
 from ..shell import run
 
+if TYPE_CHECKING:
+    import tomlkit
+
 
 class BumpVersionCommand(Command):
     """Bump version in pyproject.toml, commit & apply tag.
@@ -47,14 +52,19 @@ class Versionner:
     pyproject: tomlkit.document
 
     def __init__(self, rule: str):
-        # NB: we're using tomlkit for its roundtrip feature.
-        self.pyproject = tomlkit.parse(Path("pyproject.toml").read_text())
+        self.read_pyproject()
         self.rule = rule
 
     def read_pyproject(self):
+        # NB: we're using tomlkit for its roundtrip feature.
+        # Imported here so that other `adt` commands don't pay for it.
+        import tomlkit  # noqa: PLC0415
+
         self.pyproject = tomlkit.parse(Path("pyproject.toml").read_text())
 
     def write_pyproject(self):
+        import tomlkit  # noqa: PLC0415
+
         Path("pyproject.toml").write_text(tomlkit.dumps(self.pyproject))
 
     def get_version(self):
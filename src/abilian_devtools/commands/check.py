@@ -24,17 +24,16 @@ class CheckCommand(Command):
         print(bold("Running checks..."))
 
         args = get_targets(args)
-        args_str = " ".join(args)
 
         # Todo: more cases
         if Path("etc").joinpath("ruff.toml").exists():
-            run(f"ruff check -c etc/ruff.toml {args_str}")
+            run(["ruff", "check", "-c", "etc/ruff.toml", *args])
         else:
-            run(f"ruff check {args_str}")
+            run(["ruff", "check", *args])
 
-        run(f"flake8 {args_str}")
-        run(f"mypy --show-error-codes {args_str}")
+        run(["flake8", *args])
+        run(["mypy", "--show-error-codes", *args])
         run("pyright")
-        run(f"vulture --min-confidence 80 {args_str}")
+        run(["vulture", "--min-confidence", "80", *args])
         # TODO: currently broken
         # run("deptry .")
@@ -1,7 +1,9 @@
 # SPDX-FileCopyrightText: 2023 Abilian SAS <https://abilian.com/>
 #
 # SPDX-License-Identifier: MIT
+import os
 import shutil
+from collections.abc import Iterator
 from pathlib import Path
 
 from cleez.colors import bold, dim
@@ -17,7 +19,7 @@ class CleanCommand(Command):
 
     def run(self):
         print(bold("Removing Python bytecode cache directories..."))
-        for cache_dir in Path().rglob("**/__pycache__"):
+        for cache_dir in find_pycache_dirs("."):
             shutil.rmtree(cache_dir)
 
         print(bold("Removing other caches..."))
@@ -25,3 +27,26 @@ class CleanCommand(Command):
             if Path(cache_dir).exists():
                 print(dim(f"Removing {cache_dir}"))
                 shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def find_pycache_dirs(root: str) -> Iterator[str]:
+    """Yield the `__pycache__` directories below `root`."""
+    stack = [root]
+    while stack:
+        for entry in _subdirs(stack.pop()):
+            if entry.name == "__pycache__":
+                yield entry.path
+            else:
+                stack.append(entry.path)
+
+
+def _subdirs(path: str) -> list[os.DirEntry]:
+    # With follow_symlinks=False, is_dir() is answered from the directory
+    # listing itself (no extra stat per entry), and symlinked directories
+    # are neither walked nor handed to rmtree.
+    # Unreadable directories are skipped, like `Path.rglob()` does.
+    try:
+        with os.scandir(path) as entries:
+            return [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return []
@@ -40,7 +40,7 @@ class CruftCommand(Command):
                 print(f"Missing standard file: {std_file}")
                 success = False
 
-        if not Path("tox.init").exists() and not Path("noxfile.py").exists():
+        if not Path("tox.ini").exists() and not Path("noxfile.py").exists():
             print("Missing tox.ini or noxfile.py")
             success = False
 
@@ -24,7 +24,6 @@ class FormatCommand(Command):
         print(bold("Formatting code..."))
 
         args = get_targets(args)
-        args_str = " ".join(args)
 
-        run(f"black {args_str}")
-        run(f"isort {args_str}")
+        run(["black", *args])
+        run(["isort", *args])
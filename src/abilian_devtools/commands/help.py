@@ -34,6 +34,9 @@ def help_make():
 
 
 class MakefileParser:
+    DESCRIPTION_RE = re.compile(r"^## (.*)")
+    TARGET_RE = re.compile(r"^(\S*?):")
+
     def __init__(self):
         self.target = ""
         self.description = ""
@@ -48,9 +51,9 @@ class MakefileParser:
         if line.startswith(".PHONY:"):
             return
 
-        if m := re.match(r"^## (.*)", line):
+        if m := self.DESCRIPTION_RE.match(line):
             self.description = m.group(1)
-        elif m := re.match(r"^(\S*?):", line):
+        elif m := self.TARGET_RE.match(line):
             self.target = m.group(1)
             if self.description:
                 self.targets.append([self.target, self.description])
@@ -31,24 +31,26 @@ class SeedCommand(Command):
             self.add_file(file)
 
     def add_file(self, file):
-        name = file.name
-        metadata = self.get_metadata(file)
-        name = metadata.get("name", name)
-        if Path(name).exists():
-            print(f"{name} already exists")
-            return
-        print(f"Adding {name}...")
         content = file.read_text()
-        Path(name).write_text(content)
+        metadata = self.get_metadata(content)
+        name = metadata.get("name", file.name)
+        try:
+            with Path(name).open("x") as fd:
+                print(f"Adding {name}...")
+                fd.write(content)
+        except FileExistsError:
+            print(f"{name} already exists")
 
-    def get_metadata(self, file):
+    def get_metadata(self, content: str) -> dict[str, str]:
         metadata = {}
-        content = file.read_text()
         lines = content.splitlines()
         for line in lines:
-            if "ADT:" not in line:
+            _, marker, directive = line.partition("ADT:")
+            if not marker:
+                continue
+            key, sep, value = directive.partition("=")
+            if not sep:
                 continue
-            key, value = line.split("ADT:")[1].split("=", 1)
             metadata[key.strip()] = value.strip()
         return metadata
 
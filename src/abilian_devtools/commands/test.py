@@ -17,13 +17,12 @@ class TestCommand(Command):
     name = "test"
 
     arguments = [
-        Argument("args", nargs="?", help="Files or directories to test"),
+        Argument("args", nargs="*", help="Files or directories to test"),
     ]
 
     def run(self, args: Optional[list[str]] = None):
         print(bold("Running tests..."))
 
         args = get_targets(args)
-        args_str = " ".join(args)
 
-        run(f"pytest {args_str}")
+        run(["pytest", *args])
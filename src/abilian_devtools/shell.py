@@ -4,17 +4,21 @@
 import shlex
 import subprocess
 import sys
+from collections.abc import Sequence
 
 from cleez.colors import dim, red
 
 
-def run(cmd, echo=True, warn=False):
+def run(cmd: str | Sequence[str], echo=True, warn=False) -> int:
+    if isinstance(cmd, str):
+        args = shlex.split(cmd)
+    else:
+        args = list(cmd)
+        cmd = shlex.join(args)
     if echo:
         print(dim("> " + cmd))
-    args = shlex.split(cmd)
-    p = subprocess.Popen(args)
-    p.wait()
-    if not warn and p.returncode:
-        print(red(f"failed with error code {p.returncode}"))
+    returncode = subprocess.run(args, check=False).returncode
+    if not warn and returncode:
+        print(red(f"failed with error code {returncode}"))
         sys.exit()
-    return p.returncode
+    return returncode
@@ -0,0 +1,47 @@
+# flake8: noqa
+
+import os
+from pathlib import Path
+
+from abilian_devtools.commands.clean import find_pycache_dirs
+
+
+def _make_dirs(root: Path, *paths: str) -> None:
+    for path in paths:
+        (root / path).mkdir(parents=True)
+
+
+def _find(root: Path) -> list[str]:
+    return sorted(os.path.relpath(path, root) for path in find_pycache_dirs(str(root)))
+
+
+def test_find_nested_pycache_dirs(tmp_path):
+    _make_dirs(
+        tmp_path, "__pycache__", "a/__pycache__/x/__pycache__", "a/b/__pycache__"
+    )
+    (tmp_path / "a" / "__init__.py").touch()
+
+    assert _find(tmp_path) == ["__pycache__", "a/__pycache__", "a/b/__pycache__"]
+
+
+def test_find_does_not_follow_symlinks(tmp_path):
+    _make_dirs(tmp_path, "project", "outside/__pycache__")
+    (tmp_path / "project" / "link").symlink_to(tmp_path / "outside")
+    (tmp_path / "project" / "__pycache__").symlink_to(tmp_path / "outside")
+
+    assert _find(tmp_path / "project") == []
+
+
+def test_find_skips_unreadable_dirs(tmp_path, monkeypatch):
+    _make_dirs(tmp_path, "a/__pycache__", "denied/__pycache__")
+    denied = str(tmp_path / "denied")
+    scandir = os.scandir
+
+    def fake_scandir(path="."):
+        if os.fspath(path) == denied:
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", fake_scandir)
+
+    assert _find(tmp_path) == ["a/__pycache__"]
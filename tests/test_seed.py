@@ -0,0 +1,44 @@
+# flake8: noqa
+
+import pytest
+
+from abilian_devtools.commands.seed import SeedCommand
+
+
+@pytest.fixture
+def seed_dirs(tmp_path, monkeypatch):
+    source = tmp_path / "src" / "envrc"
+    source.parent.mkdir()
+    source.write_text("# ADT: name=.envrc\nlayout python\n")
+    project = tmp_path / "project"
+    project.mkdir()
+    monkeypatch.chdir(project)
+    return source, project
+
+
+def test_add_file_creates_target(seed_dirs, capsys):
+    source, project = seed_dirs
+
+    SeedCommand(None).add_file(source)
+
+    assert (project / ".envrc").read_text() == source.read_text()
+    assert "Adding .envrc..." in capsys.readouterr().out
+
+
+def test_add_file_keeps_existing_target(seed_dirs, capsys):
+    source, project = seed_dirs
+    (project / ".envrc").write_text("mine\n")
+
+    SeedCommand(None).add_file(source)
+
+    assert (project / ".envrc").read_text() == "mine\n"
+    assert ".envrc already exists" in capsys.readouterr().out
+
+
+def test_get_metadata():
+    content = "# ADT: name=.gitignore\n# ADT: no-equal-sign\n*.pyc\n"
+    assert SeedCommand(None).get_metadata(content) == {"name": ".gitignore"}
+
+
+def test_get_metadata_without_directives():
+    assert SeedCommand(None).get_metadata("*.pyc\n# name=foo\n") == {}
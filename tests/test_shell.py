@@ -0,0 +1,26 @@
+# flake8: noqa
+
+import shlex
+import sys
+
+from abilian_devtools.shell import run
+
+
+def test_run_argv(capsys):
+    args = [sys.executable, "-c", "print('hello world')"]
+    assert run(args) == 0
+    out = capsys.readouterr().out
+    assert f"> {shlex.join(args)}" in out
+    assert "hello world" in out
+
+
+def test_run_string(capsys):
+    cmd = f"{shlex.quote(sys.executable)} -c 'print(\"hello world\")'"
+    assert run(cmd) == 0
+    out = capsys.readouterr().out
+    assert f"> {cmd}" in out
+    assert "hello world" in out
+
+
+def test_run_warn_returns_error_code():
+    assert run([sys.executable, "-c", "raise SystemExit(3)"], warn=True) == 3